@@ -22,27 +22,32 @@ CNTL SO2 burden are shown in Fig. S1.
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
-import copy
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.cm as mpl_cm
 import matplotlib.colors as colors
 import cartopy.crs as ccrs
+import cartopy.feature as cfeature
 
 # =============================================================================
 # Load data
 # =============================================================================
 
 #Observations
-omps = np.load('omps_perturbation_daily_latlong_so2_1x1deg.npy') 
+omps = np.load('omps_perturbation_daily_latlong_so2_1x1deg.npy', mmap_mode = 'r') 
 #Model SO2+ash
-so2_ash = np.load('SO2_ash_perturbation_daily_latlong_so2_1x1deg.npy')
+so2_ash = np.load('SO2_ash_perturbation_daily_latlong_so2_1x1deg.npy', mmap_mode = 'r')
 #Model SO2only
-so2_only = np.load('SO2_only_perturbation_daily_latlong_so2_1x1deg.npy')
+so2_only = np.load('SO2_only_perturbation_daily_latlong_so2_1x1deg.npy', mmap_mode = 'r')
 
 #Create a list of MMDD for dating figures
 day_list = ['0621', '0622', '0623', '0624', '0625', '0626', '0627', '0628', '0629', '0630', '0701']
 
+#Format each date once for the panel titles
+date_labels = [day[2:] + (' June 2019' if day[1] == '6' else ' July 2019') for day in day_list]
+
 # =============================================================================
 # Plotting
 # =============================================================================
@@ -51,31 +56,31 @@ day_list = ['0621', '0622', '0623', '0624', '0625', '0626', '0627', '0628', '062
 latitude = np.arange(-90, 91)
 model_longitude = np.arange(-180, 181)
 obs_longitude = np.arange(0, 361)
+#Only 30-90N is shown, so pass just those rows to the plotting calls
+lat_plot = latitude[120:]
+
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
 
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':40,
-          'axes.linewidth':3,
-          'axes.grid': True,
+params = {'axes.titlesize':40,
           'xtick.labelsize':30,
           'ytick.labelsize':20,
-          'xtick.major.size': 8,
-          'xtick.minor.size': 5,
-          'xtick.minor.visible':True,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
           'ytick.minor.visible':False,
-          'lines.linewidth': 1.5}
+          'lines.linewidth': 1.5,
+          'path.simplify_threshold': 1.0}
 
 plt.rcParams.update(params)
 
 fig = plt.figure(figsize = (40,21), facecolor = 'w', edgecolor = 'k')
 
-col_map = copy.copy(mpl_cm.get_cmap('plasma'))
+col_map = mpl.colormaps['plasma']
 titanium_white = (1.0, 1.0, 1.0)
 lvs_so2 = [0.03, 0.06, 0.09, 0.3, 0.6, 0.9, 3, 6, 9, 30, 60]
 norm = colors.BoundaryNorm(lvs_so2, col_map.N)
 
+#Single coastline feature shared by every map panel
+coast = cfeature.NaturalEarthFeature('physical', 'coastline', '110m', edgecolor = 'black', facecolor = 'none')
+
 ind = 1
 
 for i in np.arange(21, 30, 2):
@@ -83,42 +88,33 @@ for i in np.arange(21, 30, 2):
     #Centre map on Raikoke
     #SO2only
     ax = plt.subplot(6, 3, ind, projection=ccrs.PlateCarree(central_longitude = 180))
-    plt.contourf(model_longitude, latitude, so2_only[:, :, i], levels = lvs_so2, cmap = col_map, norm = norm, extend = 'both')
+    ax.pcolormesh(model_longitude, lat_plot, so2_only[120:, :, i], cmap = col_map, norm = norm, shading = 'auto', rasterized = True)
     
-    if day_list[i - 20][1] == '6':
-        plt.title('UKESM1 SO2only: ' + day_list[i - 20][2:] + ' June 2019')
-    else: 
-        plt.title('UKESM1 SO2only: ' + day_list[i - 20][2:] + ' July 2019')
+    plt.title('UKESM1 SO2only: ' + date_labels[i - 20])
         
-    ax.coastlines()
+    ax.add_feature(coast)
     ax.set_ylim( [30, 90] )
     ax.set_xlim( [-180, 180] ) 
     ax.set_yticks([45, 60, 75])
     
     #OMPS observations
     ax = plt.subplot(6, 3, ind + 1, projection=ccrs.PlateCarree(central_longitude = 180))
-    plt.contourf(obs_longitude, latitude, omps[:, :, i], levels = lvs_so2, cmap = col_map, norm = norm, extend = 'both')
+    ax.pcolormesh(obs_longitude, lat_plot, omps[120:, :, i], cmap = col_map, norm = norm, shading = 'auto', rasterized = True)
     
-    if day_list[i - 20][1] == '6':
-        plt.title('OMPS-NM: ' + day_list[i - 20][2:] + ' June 2019')
-    else: 
-        plt.title('OMPS-NM: ' + day_list[i - 20][2:] + ' July 2019')
+    plt.title('OMPS-NM: ' + date_labels[i - 20])
         
-    ax.coastlines()
+    ax.add_feature(coast)
     ax.set_ylim( [30, 90] )
     ax.set_xlim( [-180, 180] )
     ax.set_yticks([45, 60, 75])
     
     #SO2+ash
     ax = plt.subplot(6, 3, ind + 2, projection=ccrs.PlateCarree(central_longitude = 180))
-    plt.contourf(model_longitude, latitude, so2_ash[:, :, i], levels = lvs_so2, cmap = col_map, norm = norm, extend = 'both')
+    cs = ax.pcolormesh(model_longitude, lat_plot, so2_ash[120:, :, i], cmap = col_map, norm = norm, shading = 'auto', rasterized = True)
     
-    if day_list[i - 20][1] == '6':
-        plt.title('UKESM1 SO2+ash: ' + day_list[i - 20][2:] + ' June 2019')
-    else: 
-        plt.title('UKESM1 SO2+ash: ' + day_list[i - 20][2:] + ' July 2019')
+    plt.title('UKESM1 SO2+ash: ' + date_labels[i - 20])
         
-    ax.coastlines()
+    ax.add_feature(coast)
     ax.set_ylim( [30, 90] )
     ax.set_xlim( [-180, 180] ) 
     ax.set_yticks([45, 60, 75])
@@ -126,7 +122,7 @@ for i in np.arange(21, 30, 2):
     ind = ind + 3
     
 cax = plt.axes([0.12, 0.1, 0.78, 0.040])             # Left, Bottom, Width, Height
-bar = plt.colorbar(cax=cax, orientation='horizontal')
+bar = plt.colorbar(cs, cax=cax, orientation='horizontal', extend = 'both')
 bar.set_ticks(lvs_so2)
 bar.set_ticklabels(lvs_so2)  
 
@@ -134,5 +130,6 @@ bar.set_label('Dobson Units', fontsize = 40)
 bar.ax.tick_params(labelsize = 40)
     
 plt.tight_layout()
-plt.savefig('Figure1.png', dpi = 300)
-plt.show() 
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure1.png', dpi = dpi)
@@ -20,25 +20,31 @@ above or below the factor of two limit.
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.cm as mpl_cm
 import matplotlib.colors as colors
 from matplotlib.colors import ListedColormap
 import cartopy.crs as ccrs
+import cartopy.feature as cfeature
 
 # =============================================================================
 # Load data
 # =============================================================================
 
-#Contingency table data for SO2only
-contingency_so2_only = np.load('SO2_only_perturbation_daily_latlong_so2_contingency_1x1deg.npy')
+#Contingency table data for SO2only, indexed as (day, lat, lon)
+contingency_so2_only = np.load('SO2_only_perturbation_daily_latlong_so2_contingency_1x1deg.npy', mmap_mode = 'r').transpose(2, 0, 1)
 
 #Create a list of MMDD for dating figure
 day_list = ['0621', '0622', '0623', '0624', '0625', '0626', '0627', '0628', 
             '0629', '0630', '0701', '0702', '0703', '0704', '0708', '0709', 
             '0710', '0711', '0712', '0713', '0714']
 
+#Format each date once for the panel titles
+date_labels = [day[2:] + (' June 2019' if day[1] == '6' else ' July 2019') for day in day_list]
+
 # =============================================================================
 # Plotting
 # =============================================================================
@@ -46,27 +52,26 @@ day_list = ['0621', '0622', '0623', '0624', '0625', '0626', '0627', '0628',
 #Definte latitude and longitude coordinates
 latitude = np.arange(-90, 91)
 longitude = np.arange(-180, 181)
+#Only 30-90N is shown, so pass just those rows to the plotting calls
+lat_plot = latitude[120:]
+
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
 
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':30,
-          'axes.linewidth':3,
-          'axes.grid': True,
+params = {'axes.titlesize':30,
           'xtick.labelsize':20,
           'ytick.labelsize':20,
-          'xtick.major.size': 8,
           'xtick.minor.size': 0,
           'xtick.minor.visible':False,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
           'ytick.minor.visible':False,
-          'lines.linewidth': 1.5}
+          'lines.linewidth': 1.5,
+          'path.simplify_threshold': 1.0}
 
 plt.rcParams.update(params)
 
 fig = plt.figure(figsize = (30,15), facecolor = 'w', edgecolor = 'k')
 
-cmap = mpl_cm.get_cmap('plasma', 4) 
+cmap = mpl.colormaps['plasma'].resampled(4)
 white = (1.0, 1.0, 1.0, 1.0)
 new_colors = cmap(np.linspace(0, 1, 4))
 new_colors[0, :] = white
@@ -75,20 +80,20 @@ new_cmap = ListedColormap(new_colors)
 lvs_ct = [0.5, 1.5, 2.5, 3.5, 4.5]
 norm_ct = colors.BoundaryNorm(lvs_ct, new_cmap.N)
 
+#Single coastline feature shared by every map panel
+coast = cfeature.NaturalEarthFeature('physical', 'coastline', '110m', edgecolor = 'black', facecolor = 'none')
+
 ind = 1
 
 for i in np.arange(21, 31, 1):
     
     #Centre map on Raikoke
     ax = plt.subplot(5, 2, ind, projection=ccrs.PlateCarree(central_longitude = 180))
-    plt.pcolormesh(longitude, latitude, contingency_so2_only[:, :, i - 21], cmap = new_cmap, norm = norm_ct, vmin = 1, vmax = 4)
+    plt.pcolormesh(longitude, lat_plot, contingency_so2_only[i - 21, 120:, :], cmap = new_cmap, norm = norm_ct, rasterized = True)
     
-    if day_list[i - 20][1] == '6':
-        plt.title(day_list[i - 20][2:] + ' June 2019 - SO2only')
-    else: 
-        plt.title(day_list[i - 20][2:] + ' July 2019 - SO2only')
+    plt.title(date_labels[i - 20] + ' - SO2only')
         
-    ax.coastlines()
+    ax.add_feature(coast)
     ax.set_ylim( [30, 90] )
     ax.set_xlim( [-180, 180] ) 
     ax.set_yticks([45, 60, 75])
@@ -101,5 +106,6 @@ bar.set_ticks([1, 2, 3, 4])
 bar.set_ticklabels(['Correct Negative', 'Obs > Model', 'Model > Obs', 'Hits'])  
     
 plt.tight_layout()
-plt.savefig('Figure2.png', dpi = 300)
-plt.show() 
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure2.png', dpi = dpi)
@@ -22,21 +22,25 @@ those for SO2only and SO2+ash.
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
 import math
-import copy
+from numba import njit
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
+from common import weighted_mean
 
 # =============================================================================
 # Load data
 # =============================================================================
     
 #Observations
-omps = np.load('omps_perturbation_daily_latlong_so2_1x1deg.npy')
+omps = np.load('omps_perturbation_daily_latlong_so2_1x1deg.npy').astype(np.float32, copy = False)
 #Model SO2+ash 
-so2_ash = np.load('SO2_ash_perturbation_daily_area_average_so2.npy')
+so2_ash = np.load('SO2_ash_perturbation_daily_area_average_so2.npy').astype(np.float32, copy = False)
 #Model SO2onlu
-so2_only = np.load('SO2_only_perturbation_daily_area_average_so2.npy')
+so2_only = np.load('SO2_only_perturbation_daily_area_average_so2.npy').astype(np.float32, copy = False)
  
 # =============================================================================
 # Calculate area average
@@ -45,11 +49,8 @@ so2_only = np.load('SO2_only_perturbation_daily_area_average_so2.npy')
 #Create zonal mean omps
 omps_lon_averaged = np.nanmean(omps, axis = 1)
 
-latitude = range(-90, 91)
-#Latitude weighting
-weighting = np.cos(np.deg2rad(latitude))
 #Average over 30-90N using weighted average based on latitude
-omps_area_average = np.ma.average(np.ma.masked_invalid(omps_lon_averaged[120:, :]), axis = 0, weights = weighting[120:])
+omps_area_average = weighted_mean(omps_lon_averaged[120:, :])
  
 #Create array of days since eruption 
 days = np.arange(-20, 102, 1)
@@ -58,23 +59,24 @@ days = np.arange(-20, 102, 1)
 # Calculate e-folding times
 # =============================================================================
 
-def find_nearest(array, value):
-    
-    array = np.asarray(array)
-    idx = (np.abs(array - value)).argmin()
-    
-    return idx
-
+@njit(cache = True)
 def e_folding_time(data):
     
-    #create copy of data (start from eruption day, 20) and set nan to zero
-    data_copy = copy.copy(data[20:])
-    data_copy[np.isnan(data_copy)] = 0.0 
+    #Start from eruption day (20) with nan set to zero
+    data_copy = np.where(np.isnan(data[20:]), 0.0, data[20:])
     
     #Find the x index of the maxmimum point 
-    x_max = find_nearest(data_copy, np.nanmax(data_copy))
-    #Find the x index of the max point / e
-    x_e = x_max + find_nearest(data_copy[x_max:], (np.nanmax(data_copy) / math.e))
+    x_max = 0
+    for x in range(data_copy.size):
+        if data_copy[x] > data_copy[x_max]:
+            x_max = x
+            
+    #Find the x index after the maximum closest to the max point / e
+    peak_e = data_copy[x_max] / math.e
+    x_e = x_max
+    for x in range(x_max, data_copy.size):
+        if abs(data_copy[x] - peak_e) < abs(data_copy[x_e] - peak_e):
+            x_e = x
 
     e_time = x_e - x_max
     
@@ -92,19 +94,11 @@ so2_only_e_time = e_folding_time(so2_only)
 # Plotting
 # =============================================================================
     
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':35,
-          'axes.linewidth':3,
-          'axes.grid': True,
-          'xtick.labelsize':30,
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
+
+params = {'xtick.labelsize':30,
           'ytick.labelsize':30,
-          'xtick.major.size': 8,
-          'xtick.minor.size': 5,
-          'xtick.minor.visible':True,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
-          'ytick.minor.visible':True,
           'lines.linewidth': 6}
 
 plt.rcParams.update(params)
@@ -124,5 +118,6 @@ plt.ylabel('SO2 (Dobson Units)')
 plt.legend()
 
 plt.tight_layout()
-plt.savefig('Figure3.png', dpi = 300)
-plt.show()
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure3.png', dpi = dpi)
@@ -24,54 +24,58 @@ to 532nm. The location of Raikoke is marked with a black cross.
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
-import copy
 import calendar
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.colors as colors
-import matplotlib.cm as mpl_cm
 
 # =============================================================================
 # Load data
 # =============================================================================
 
 #Model SO2+ash with OMPS detection limits imposed
-so2_ash_omps = np.load('SO2_ash_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy')
+so2_ash_omps = np.load('SO2_ash_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2only with OMPS detection limits imposed
-so2_only_omps = np.load('SO2_only_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy')
+so2_only_omps = np.load('SO2_only_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2+ash with CALIOP detection limits imposed
-so2_ash_caliop = np.load('SO2_ash_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy')
+so2_ash_caliop = np.load('SO2_ash_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2only with CALIOP detection limits imposed
-so2_only_caliop = np.load('SO2_only_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy')
+so2_only_caliop = np.load('SO2_only_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 
 #OMPS observations
-omps = np.load('omps_perturbation_daily_zonal_average_aod_532nm.npy')
+omps = np.load('omps_perturbation_daily_zonal_average_aod_532nm.npy', mmap_mode = 'r')
 #CALIOP observations
-caliop = np.load('caliop_perturbation_daily_zonal_average_aod_532nm.npy')
+caliop = np.load('caliop_perturbation_daily_zonal_average_aod_532nm.npy', mmap_mode = 'r')
     
+#Only 30-90N is plotted, so only those rows are read and converted to float32
+lat_window = slice(120, 181)
+omps_window = omps[lat_window].astype(np.float32)
+caliop_window = caliop[lat_window].astype(np.float32)
+
 # =============================================================================
 # Create the omps model mask
 # =============================================================================
 
 #Find model points only where omps data exists
-mask = np.ones( (181, 366) )
-mask[np.isnan(omps)] = np.nan
+omps_missing = np.isnan(omps_window)
 
 #Mask the model data
-so2_ash_omps_limits = so2_ash_omps*mask
-so2_only_omps_limits = so2_only_omps*mask
+so2_ash_omps_limits = np.where(omps_missing, np.nan, so2_ash_omps[lat_window].astype(np.float32))
+so2_only_omps_limits = np.where(omps_missing, np.nan, so2_only_omps[lat_window].astype(np.float32))
 
 # =============================================================================
 # Create the calipso model mask
 # =============================================================================
 
 #Find model points only where calipso data exists
-mask = np.ones( (181, 366) )
-mask[np.isnan(caliop)] = np.nan
+caliop_missing = np.isnan(caliop_window)
 
 #Mask the model data
-so2_ash_caliop_limits = so2_ash_caliop*mask      
-so2_only_caliop_limits = so2_only_caliop*mask    
+so2_ash_caliop_limits = np.where(caliop_missing, np.nan, so2_ash_caliop[lat_window].astype(np.float32))
+so2_only_caliop_limits = np.where(caliop_missing, np.nan, so2_only_caliop[lat_window].astype(np.float32))
 
 # =============================================================================
 # Plotting
@@ -82,16 +86,17 @@ dates = np.arange(-20, 346, 1)
 
 #Definite latitude coordinates and ticks
 latitude = range(0, 91)
+lat_plot = latitude[30:]
 lat_ticks = np.arange(45, 90, 15)
 date_ticks = [-20, 10, 41, 72, 102, 133, 163, 194, 225, 254, 285, 315]
 
 #Get months for plotting dates
-months = calendar.month_name[6:13] + calendar.month_name[1:6]
-for i in range(len(months)):
-    months[i] = months[i][:3]
+months = [month[:3] for month in calendar.month_name[6:13] + calendar.month_name[1:6]]
+
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
 
-params = {'legend.fontsize': 25,
-          'figure.figsize': (55, 25), #landscape
+params = {'figure.figsize': (55, 25), #landscape
           'axes.labelsize': 60,
           'axes.titlesize': 60,
           'axes.linewidth': 5,
@@ -99,16 +104,12 @@ params = {'legend.fontsize': 25,
           'xtick.labelsize':50,
           'ytick.labelsize':55,
           'xtick.major.size': 15,
-          'xtick.minor.size': 5,
           'xtick.minor.visible':False,
-          'ytick.major.size':15,
-          'ytick.minor.size':5,
-          'ytick.minor.visible':True,
-          'lines.linewidth': 4} 
+          'ytick.major.size':15}
 
 plt.rcParams.update(params)
 
-col_map = copy.copy(mpl_cm.get_cmap('plasma'))
+col_map = mpl.colormaps['plasma']
 lvs = np.logspace(-3, -1, 13)
 cbar_ticks = [0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1]
 norm = colors.BoundaryNorm(lvs, col_map.N)
@@ -117,76 +118,36 @@ norm = colors.BoundaryNorm(lvs, col_map.N)
 fig = plt.figure(constrained_layout = True)
 gs = fig.add_gridspec(3, 3, height_ratios = [20, 20, 4], width_ratios = [25, 25, 25])
 
-#(c) OMPS
-ax1 = fig.add_subplot(gs[0,1])
-ax1.contourf(dates, latitude, omps[90:, :], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
-ax1.plot(0, 48, 'x', color = 'k', markersize = 20, markeredgewidth = 5)
-ax1.set_title('OMPS-LP scaled to 532nm', fontweight = 'bold')
-ax1.set_ylabel('Latitude')
-ax1.set_yticks(lat_ticks)
-ax1.set_xticks(date_ticks)
-ax1.set_xticklabels(months, rotation = 45)
-ax1.set_ylim(30, 90)
-
-#(d) CALIOP
-ax2 = fig.add_subplot(gs[1, 1])
-cb = ax2.contourf(dates, latitude, caliop[90:, :], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
-ax2.plot(0, 48, 'x', color = 'k', markersize = 20, markeredgewidth = 5)
-ax2.set_title('CALIOP 532nm', fontweight = 'bold')
-ax2.set_ylabel('Latitude')
-ax2.set_yticks(lat_ticks)
-ax2.set_xticks(date_ticks)
-ax2.set_xticklabels(months, rotation = 45)
-ax2.set_ylim(30, 90)
-
-#(a) Model SO2only with OMPS limits
-ax3 = fig.add_subplot(gs[0, 0])
-cb = ax3.contourf(dates, latitude, so2_only_omps_limits[90:, :], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
-ax3.plot(0, 48, 'x', color = 'k', markersize = 20, markeredgewidth = 5)
-ax3.set_title('UKESM1 SO2only OMPS-LP limits', fontweight = 'bold')
-ax3.set_ylabel('Latitude')
-ax3.set_yticks(lat_ticks)
-ax3.set_xticks(date_ticks)
-ax3.set_xticklabels(months, rotation = 45)
-ax3.set_ylim(30, 90)
-
-#(b) Model SO2only with CALIOP limits
-ax4 = fig.add_subplot(gs[1, 0])
-cb = ax4.contourf(dates, latitude, so2_only_caliop_limits[90:, :], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
-ax4.plot(0, 48, 'x', color = 'k', markersize = 20, markeredgewidth = 5)
-ax4.set_title('UKESM1 SO2only CALIOP limits', fontweight = 'bold')
-ax4.set_ylabel('Latitude')
-ax4.set_xticks(date_ticks)
-ax4.set_xticklabels(months, rotation = 45)
-ax4.set_yticks(lat_ticks)
-ax4.set_ylim(30, 90)
-
-#(e) Model SO2+ash with OMPS limits
-ax5 = fig.add_subplot(gs[0, 2])
-cb = ax5.contourf(dates, latitude, so2_ash_omps_limits[90:, :], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
-ax5.plot(0, 48, 'x', color = 'k', markersize = 20, markeredgewidth = 5)
-ax5.set_title('UKESM1 SO2+ash OMPS-LP limits', fontweight = 'bold')
-ax5.set_ylabel('Latitude')
-ax5.set_yticks(lat_ticks)
-ax5.set_xticks(date_ticks)
-ax5.set_xticklabels(months, rotation = 45)
-ax5.set_ylim(30, 90)
-
-#(f) Model SO2+ash with CALIOP limits
-ax6 = fig.add_subplot(gs[1, 2])
-cb = ax6.contourf(dates, latitude, so2_ash_caliop_limits[90:, :], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
-ax6.plot(0, 48, 'x', color = 'k', markersize = 20, markeredgewidth = 5)
-ax6.set_title('UKESM1 SO2+ash CALIOP limits', fontweight = 'bold')
-ax6.set_ylabel('Latitude')
-ax6.set_xticks(date_ticks)
-ax6.set_xticklabels(months, rotation = 45)
-ax6.set_yticks(lat_ticks)
-ax6.set_ylim(30, 90)
+def decorate_panel(ax, title):
+    
+    #Mark Raikoke and apply the shared latitude-time axis styling
+    ax.plot(0, 48, 'x', color = 'k', markersize = 20, markeredgewidth = 5)
+    ax.set_title(title, fontweight = 'bold')
+    ax.set_ylabel('Latitude')
+    ax.set_yticks(lat_ticks)
+    ax.set_xticks(date_ticks)
+    ax.set_xticklabels(months, rotation = 45)
+    ax.set_ylim(30, 90)
+
+#Grid position, data and title for panels (a)-(f)
+panels = [(gs[0, 0], so2_only_omps_limits, 'UKESM1 SO2only OMPS-LP limits'),
+          (gs[1, 0], so2_only_caliop_limits, 'UKESM1 SO2only CALIOP limits'),
+          (gs[0, 1], omps_window, 'OMPS-LP scaled to 532nm'),
+          (gs[1, 1], caliop_window, 'CALIOP 532nm'),
+          (gs[0, 2], so2_ash_omps_limits, 'UKESM1 SO2+ash OMPS-LP limits'),
+          (gs[1, 2], so2_ash_caliop_limits, 'UKESM1 SO2+ash CALIOP limits')]
+
+for position, data, title in panels:
+    
+    ax = fig.add_subplot(position)
+    cb = ax.pcolormesh(dates, lat_plot, data, cmap = col_map, norm = norm, shading = 'auto', rasterized = True)
+    decorate_panel(ax, title)
 
 cax = fig.add_subplot(gs[-1, :])
-cbar = fig.colorbar(cb, cax = cax, ticks = cbar_ticks, orientation='horizontal')
+cbar = fig.colorbar(cb, cax = cax, ticks = cbar_ticks, orientation='horizontal', extend = 'both')
 cbar.set_label('sAOD', fontsize=60)
 cbar.ax.tick_params(size=0, labelsize = 50)
 
-plt.savefig('Figure4.png', dpi = 300)
-plt.show()
\ No newline at end of file
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure4.png', dpi = dpi, pil_kwargs = {'compress_level': 3})
@@ -19,32 +19,31 @@ stratospheric perturbation for the observations.
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
+from common import weighted_mean
 
 # =============================================================================
 # Load data
 # =============================================================================
 
 #OMPS sAOD
-omps = np.load('omps_perturbation_daily_zonal_average_aod_532nm.npy')
+omps = np.load('omps_perturbation_daily_zonal_average_aod_532nm.npy', mmap_mode = 'r')
 #CALIOP sAOD
-caliop = np.load('caliop_perturbation_daily_zonal_average_aod_532nm.npy')
+caliop = np.load('caliop_perturbation_daily_zonal_average_aod_532nm.npy', mmap_mode = 'r')
 #Combined sAOD dataset averaged over 30-90N
-combo_area_average = np.load('combined_dataset_area_average_aod_532nm.npy')
+combo_area_average = np.load('combined_dataset_area_average_aod_532nm.npy').astype(np.float32)
 
 # =============================================================================
 # Area average observed data sets across 30-90N
 # =============================================================================
 
-latitude = range(-90, 91)
-#Latitude weighting
-weighting = np.cos(np.deg2rad(latitude))
-
-#Average over 30-90N using weighted averages based on latitudes=
-caliop_mean = np.ma.average(np.ma.masked_invalid(caliop[120:, :]), axis = 0, weights = weighting[120:])
-caliop_area_average = caliop_mean.filled(fill_value=np.nan)
-omps_area_average = np.ma.average(np.ma.masked_invalid(omps[120:, :]), axis = 0, weights = weighting[120:])
+#Average over 30-90N using weighted averages based on latitudes
+caliop_area_average = weighted_mean(caliop[120:, :].astype(np.float32))
+omps_area_average = weighted_mean(omps[120:, :].astype(np.float32))
     
 #Create array of days since eruption    
 days = np.arange(-20, 346, 1)
@@ -53,20 +52,10 @@ days = np.arange(-20, 346, 1)
 # Plotting
 # =============================================================================
     
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':35,
-          'axes.linewidth':3,
-          'axes.grid': True,
-          'xtick.labelsize':25,
-          'ytick.labelsize':25,
-          'xtick.major.size': 8,
-          'xtick.minor.size': 5,
-          'xtick.minor.visible':True,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
-          'ytick.minor.visible':True,
-          'lines.linewidth': 5}
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
+
+params = {'lines.linewidth': 5}
 
 plt.rcParams.update(params)
 
@@ -83,5 +72,6 @@ plt.xlabel('Day since eruption')
 plt.ylabel('sAOD')
 plt.legend()
 
-plt.savefig('Figure5.png', dpi = 300)
-plt.show()
\ No newline at end of file
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure5.png', dpi = dpi)
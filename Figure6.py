@@ -18,23 +18,25 @@ sAOD derived from OMPS-LP and CALIOP for the years 2013–2018 from those for
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
-import copy
 import calendar
 
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.cm as mpl_cm
 import matplotlib.colors as colors
 import cartopy.crs as ccrs
+import cartopy.feature as cfeature
 
 # =============================================================================
 # Load data
 # =============================================================================
 
 #CALIOP sAOD
-caliop = np.load('calipso_perturbation_monthly_latlong_aod_532nm.npy')
+caliop = np.load('calipso_perturbation_monthly_latlong_aod_532nm.npy', mmap_mode = 'r')
 #OMPS sAOD
-omps = np.load('omps_perturbation_monthly_latlong_aod_532nm.npy') 
+omps = np.load('omps_perturbation_monthly_latlong_aod_532nm.npy', mmap_mode = 'r') 
 
 # =============================================================================
 # Plotting
@@ -46,30 +48,31 @@ month_list = np.arange(7, 13)
 #Definte latitude and longitude coordinates
 latitude = range(-90, 91)
 longitude = range(-180, 181, 4)
+#Only 0-90N is shown, so pass just those rows to the plotting calls
+lat_plot = latitude[90:]
 
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':20,
-          'axes.linewidth':3,
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
+
+params = {'axes.titlesize':20,
           'axes.grid': False,
           'xtick.labelsize':20,
           'ytick.labelsize':20,
-          'xtick.major.size': 8,
-          'xtick.minor.size': 5,
-          'xtick.minor.visible':True,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
           'ytick.minor.visible':False,
-          'lines.linewidth': 1.5}
+          'lines.linewidth': 1.5,
+          'path.simplify_threshold': 1.0}
 
 plt.rcParams.update(params)
 
 fig = plt.figure(figsize = (20,20), facecolor = 'w', edgecolor = 'k')
  
-col_map = copy.copy(mpl_cm.get_cmap('plasma'))
+col_map = mpl.colormaps['plasma']
 lvs = np.logspace(-2.3, -1, 12)
 norm = colors.BoundaryNorm(lvs, col_map.N)
 
+#Single coastline feature shared by every map panel
+coast = cfeature.NaturalEarthFeature('physical', 'coastline', '110m', edgecolor = 'black', facecolor = 'none')
+
 ind = 1
 
 for i in range(6):
@@ -77,12 +80,11 @@ for i in range(6):
     #Centre map on Raikoke
     #OMPS
     ax = plt.subplot(7, 2, ind, projection=ccrs.PlateCarree(central_longitude = 180))
-    cs = plt.contourf(longitude, latitude, omps[:, :, i+1], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
+    ax.set_extent([-180, 180, 0, 90], crs = ax.projection)
+    cs = ax.pcolormesh(longitude, lat_plot, omps[90:, :, i+1], cmap = col_map, norm = norm, shading = 'auto', rasterized = True)
     plt.title('OMPS-LP scaled to 532nm : ' + calendar.month_name[month_list[i]] + ' 2019')
         
-    ax.coastlines()
-    ax.set_ylim( [0, 90] )
-    ax.set_xlim( [-180, 180] )
+    ax.add_feature(coast)
     ax.set_yticks([15, 30, 45, 60, 75])
     
     #Plot marker on MLO
@@ -91,23 +93,24 @@ for i in range(6):
     
     #CALIOP
     ax = plt.subplot(7, 2, ind + 1, projection=ccrs.PlateCarree(central_longitude = 180))
-    cs = plt.contourf(longitude, latitude, caliop[:, :, i+1], levels = lvs, cmap = col_map, norm = norm, extend = 'both')
+    ax.set_extent([-180, 180, 0, 90], crs = ax.projection)
+    cs = ax.pcolormesh(longitude, lat_plot, caliop[90:, :, i+1], cmap = col_map, norm = norm, shading = 'auto', rasterized = True)
     plt.title('CALIOP 532nm : ' + calendar.month_name[month_list[i]] + ' 2019')
         
-    ax.coastlines()
-    ax.set_ylim( [0, 90] )
-    ax.set_xlim( [-180, 180] )
+    ax.add_feature(coast)
     ax.set_yticks([15, 30, 45, 60, 75])
     
     ind = ind + 2
     
 cax = plt.axes([0.12, 0.1, 0.78, 0.040])             # Left, Bottom, Width, Height
-bar = plt.colorbar(cax=cax, orientation='horizontal')
+bar = plt.colorbar(cs, cax=cax, orientation='horizontal', extend = 'both')
 bar.set_ticks(np.logspace(-2.3, -1, 6))
 bar.set_ticklabels(np.round(np.logspace(-2.3, -1, 6), 3))  
 bar.set_label('Aerosol Optical Depth 550nm')
 bar.ax.tick_params(labelsize = 30)
     
-plt.tight_layout()
-plt.savefig('Figure6.png', dpi = 300)
-plt.show()   
\ No newline at end of file
+#Fixed margins matching the old tight_layout, so the figure is only drawn once when saved
+fig.subplots_adjust(left = 0.035, right = 0.99, top = 0.98, bottom = 0.01, wspace = 0.07, hspace = 0.13)
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure6.png', dpi = dpi, pil_kwargs = {'compress_level': 3})
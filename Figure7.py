@@ -22,70 +22,64 @@ sAOD from the CNTL simulation from those for SO2only and SO2+ash.
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
+from common import weighted_mean
 
 # =============================================================================
 # Load data
 # =============================================================================
 
 #Model SO2+ash
-so2_ash = np.load('SO2_ash_perturbation_daily_zonal_average_aod_532nm_1x1deg.npy')
+so2_ash = np.load('SO2_ash_perturbation_daily_zonal_average_aod_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2only 
-so2_only = np.load('SO2_only_perturbation_daily_zonal_average_aod_532nm_1x1deg.npy')
+so2_only = np.load('SO2_only_perturbation_daily_zonal_average_aod_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2+ash with OMPS detection limits
-so2_ash_omps = np.load('SO2_ash_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy')
+so2_ash_omps = np.load('SO2_ash_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2only with OMPS detection limits
-so2_only_omps = np.load('SO2_only_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy')
+so2_only_omps = np.load('SO2_only_perturbation_daily_zonal_average_aod_omps_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2+ash with CALIOP detection limits
-so2_ash_caliop = np.load('SO2_ash_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy')
+so2_ash_caliop = np.load('SO2_ash_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 #Model SO2only with CALIOP detection limits
-so2_only_caliop = np.load('SO2_only_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy')
+so2_only_caliop = np.load('SO2_only_perturbation_daily_zonal_average_aod_caliop_limits_532nm_1x1deg.npy', mmap_mode = 'r')
 
 #CALIOP observations
-caliop = np.load('caliop_perturbation_daily_zonal_average_aod_532nm.npy')
+caliop = np.load('caliop_perturbation_daily_zonal_average_aod_532nm.npy', mmap_mode = 'r')
 #OMPS observations
-omps = np.load('omps_perturbation_daily_zonal_average_aod_532nm.npy')
+omps = np.load('omps_perturbation_daily_zonal_average_aod_532nm.npy', mmap_mode = 'r')
 #Combined sAOD dataset averaged over 30-90N
-combo_area_average = np.load('combined_dataset_area_average_aod_532nm.npy')
+combo_area_average = np.load('combined_dataset_area_average_aod_532nm.npy').astype(np.float32)
 
 # =============================================================================
 # Create the combined dataset mask
 # =============================================================================
 
-#Find model points only where calipso and omps data exists
-calipso_mask = np.ones( (181, 147) )
-calipso_mask[np.isnan(caliop[:, :147])] = np.nan
-omps_mask = np.ones( (181, 219) )
-omps_mask[np.isnan(omps[:, 147:])] = np.nan
+#Only 30-90N is averaged, so only those rows are read and converted to float32
+#Find model points only where calipso (first 147 days) and omps (the rest) data exists
+obs_valid = np.concatenate([~np.isnan(caliop[120:, :147]), ~np.isnan(omps[120:, 147:])], axis = 1)
 
 #Mask the model data SO2+ash
-so2_ash_masked = np.zeros( (181, 366) )
-so2_ash_masked[:] = np.nan
-so2_ash_masked[:, :147] = so2_ash_caliop[:, :147] * calipso_mask
-so2_ash_masked[:, 147:] = so2_ash_omps[:, 147:] * omps_mask
+so2_ash_combo = np.concatenate([so2_ash_caliop[120:, :147], so2_ash_omps[120:, 147:]], axis = 1, dtype = np.float32)
+so2_ash_masked = np.where(obs_valid, so2_ash_combo, np.float32(np.nan))
 
 #Mask the model data SO2only
-so2_only_masked = np.zeros( (181, 366) )
-so2_only_masked[:] = np.nan
-so2_only_masked[:, :147] = so2_only_caliop[:, :147] * calipso_mask
-so2_only_masked[:, 147:] = so2_only_omps[:, 147:] * omps_mask
+so2_only_combo = np.concatenate([so2_only_caliop[120:, :147], so2_only_omps[120:, 147:]], axis = 1, dtype = np.float32)
+so2_only_masked = np.where(obs_valid, so2_only_combo, np.float32(np.nan))
 
 # =============================================================================
 # Calculate area averages
 # =============================================================================
     
-latitude = range(-90, 91)
-#Latitude weighting
-weighting = np.cos(np.deg2rad(latitude))
-
 #Average over 30-90N using weighted averages based on latitude
 #Models with masks
-so2_ash_masked_mean = np.ma.average(np.ma.masked_invalid(so2_ash_masked[120:, :]), axis = 0, weights = weighting[120:])
-so2_only_masked_mean = np.ma.average(np.ma.masked_invalid(so2_only_masked[120:, :]), axis = 0, weights = weighting[120:])
+so2_ash_masked_mean = weighted_mean(so2_ash_masked)
+so2_only_masked_mean = weighted_mean(so2_only_masked)
 #Models without masks
-so2_ash_mean = np.ma.average(np.ma.masked_invalid(so2_ash[120:, :]), axis = 0, weights = weighting[120:])
-so2_only_mean = np.ma.average(np.ma.masked_invalid(so2_only[120:, :]), axis = 0, weights = weighting[120:])
+so2_ash_mean = weighted_mean(so2_ash[120:, :].astype(np.float32))
+so2_only_mean = weighted_mean(so2_only[120:, :].astype(np.float32))
 
 # =============================================================================
 # Plotting
@@ -94,20 +88,10 @@ so2_only_mean = np.ma.average(np.ma.masked_invalid(so2_only[120:, :]), axis = 0,
 #Create array of days since eruption
 days = np.arange(-20, 346, 1)
     
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':35,
-          'axes.linewidth':3,
-          'axes.grid': True,
-          'xtick.labelsize':25,
-          'ytick.labelsize':25,
-          'xtick.major.size': 8,
-          'xtick.minor.size': 5,
-          'xtick.minor.visible':True,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
-          'ytick.minor.visible':True,
-          'lines.linewidth': 5} 
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
+
+params = {'lines.linewidth': 5}
 
 plt.rcParams.update(params)
 
@@ -126,8 +110,10 @@ ax.grid(which = 'minor', axis = 'x', alpha = 0.2)
 
 plt.xlabel('Day since eruption')
 plt.ylabel('sAOD')
-plt.legend()
+plt.legend(loc = 'upper right')
 
-plt.tight_layout()
-plt.savefig('Figure7.png', dpi = 600)
-plt.show()
\ No newline at end of file
+#Fixed margins matching the old tight_layout, so the figure is only drawn once when saved
+fig.subplots_adjust(left = 0.09, right = 0.99, top = 0.98, bottom = 0.1)
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 600
+plt.savefig('Figure7.png', dpi = dpi, pil_kwargs = {'compress_level': 3})
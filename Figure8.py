@@ -16,34 +16,40 @@ and UKESM1 SO2+ash (dark red). Calculated using area weighted sAOD between
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
+from common import weighted_mean
 
 # =============================================================================
 # Load data
 # =============================================================================
 
+#Only 30-90N is averaged, so only those rows are read and converted to float32
+
 #Model data for SO2 + ash
-so2_ash_550 = np.load('SO2_ash_perturbation_daily_zonal_average_aod_510nm_1x1deg.npy')
-so2_ash_865 = np.load('SO2_ash_perturbation_daily_zonal_average_aod_865nm_1x1deg.npy')
+so2_ash_550 = np.load('SO2_ash_perturbation_daily_zonal_average_aod_510nm_1x1deg.npy', mmap_mode = 'r')[120:].astype(np.float32)
+so2_ash_865 = np.load('SO2_ash_perturbation_daily_zonal_average_aod_865nm_1x1deg.npy', mmap_mode = 'r')[120:].astype(np.float32)
 
 #Model data for SO2 only
-so2_only_550 = np.load('SO2_only_perturbation_daily_zonal_average_aod_510nm_1x1deg.npy')
-so2_only_865 = np.load('SO2_only_perturbation_daily_zonal_average_aod_865nm_1x1deg.npy')
+so2_only_550 = np.load('SO2_only_perturbation_daily_zonal_average_aod_510nm_1x1deg.npy', mmap_mode = 'r')[120:].astype(np.float32)
+so2_only_865 = np.load('SO2_only_perturbation_daily_zonal_average_aod_865nm_1x1deg.npy', mmap_mode = 'r')[120:].astype(np.float32)
     
 #Original omps data 510nm and 869nm
-omps_510 = np.load('omps_perturbation_daily_zonal_average_aod_510nm.npy')
-omps_869 = np.load('omps_perturbation_daily_zonal_average_aod_869nm.npy')
+omps_510 = np.load('omps_perturbation_daily_zonal_average_aod_510nm.npy', mmap_mode = 'r')[120:].astype(np.float32)
+omps_869 = np.load('omps_perturbation_daily_zonal_average_aod_869nm.npy', mmap_mode = 'r')[120:].astype(np.float32)
 
 # =============================================================================
 # Create the omps model mask
 # =============================================================================
 
 #Find model points only where omps data exists
-mask510 = np.ones( (181, 366) )
+mask510 = np.ones( (61, 366), dtype = np.float32 )
 mask510[np.isnan(omps_510)] = np.nan
 
-mask869 = np.ones( (181, 366) )
+mask869 = np.ones( (61, 366), dtype = np.float32 )
 mask869[np.isnan(omps_869)] = np.nan
 
 #Mask the model data
@@ -57,19 +63,15 @@ so2_only_865_masked = so2_only_865*mask510
 # Calculate area averages
 # =============================================================================
     
-latitude = range(-90, 91)
-#Latitude weighting
-weighting = np.cos(np.deg2rad(latitude))
-   
 #Average over 30-90N using weighted averages based on latitude 
-so2_ash_550_mean = np.ma.average(np.ma.masked_invalid(so2_ash_550_masked[120:, :]), axis = 0, weights = weighting[120:])
-so2_ash_865_mean = np.ma.average(np.ma.masked_invalid(so2_ash_865_masked[120:, :]), axis = 0, weights = weighting[120:])
+so2_ash_550_mean = weighted_mean(so2_ash_550_masked)
+so2_ash_865_mean = weighted_mean(so2_ash_865_masked)
 
-so2_only_550_mean = np.ma.average(np.ma.masked_invalid(so2_only_550_masked[120:, :]), axis = 0, weights = weighting[120:])
-so2_only_865_mean = np.ma.average(np.ma.masked_invalid(so2_only_865_masked[120:, :]), axis = 0, weights = weighting[120:])
+so2_only_550_mean = weighted_mean(so2_only_550_masked)
+so2_only_865_mean = weighted_mean(so2_only_865_masked)
 
-omps_510_mean = np.ma.average(np.ma.masked_invalid(omps_510[120:, :]), axis = 0, weights = weighting[120:])
-omps_869_mean = np.ma.average(np.ma.masked_invalid(omps_869[120:, :]), axis = 0, weights = weighting[120:])
+omps_510_mean = weighted_mean(omps_510)
+omps_869_mean = weighted_mean(omps_869)
 
 #Create array of days since eruption
 days = np.arange(0, 346, 1)
@@ -78,29 +80,19 @@ days = np.arange(0, 346, 1)
 # Plotting
 # =============================================================================
     
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':35,
-          'axes.linewidth':3,
-          'axes.grid': True,
-          'xtick.labelsize':25,
-          'ytick.labelsize':25,
-          'xtick.major.size': 8,
-          'xtick.minor.size': 5,
-          'xtick.minor.visible':True,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
-          'ytick.minor.visible':True,
-          'lines.linewidth': 4}
-
-plt.rcParams.update(params)
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
 
 fig, ax = plt.subplots(figsize=(20, 12))
 
 #Calculate the Angstrom exponent -log(aod_1/aod_2)/log(wavelength_1/wavelength_2)
-AE_so2_ash = - (np.log(so2_ash_550_mean/so2_ash_865_mean))/(np.log(510/865))
-AE_so2_only = - (np.log(so2_only_550_mean/so2_only_865_mean))/(np.log(510/865))
-AE_omps = - (np.log(omps_510_mean/omps_869_mean))/(np.log(510/869))
+#Wavelength terms are constant, so take their negative reciprocals once
+model_wavelength_factor = -1 / np.log(510/865)
+omps_wavelength_factor = -1 / np.log(510/869)
+
+AE_so2_ash = np.log(so2_ash_550_mean/so2_ash_865_mean) * model_wavelength_factor
+AE_so2_only = np.log(so2_only_550_mean/so2_only_865_mean) * model_wavelength_factor
+AE_omps = np.log(omps_510_mean/omps_869_mean) * omps_wavelength_factor
 
 #Find average AE
 AE_so2_ash_mean = np.nanmean(AE_so2_ash)
@@ -123,5 +115,6 @@ plt.xlabel('Days since eruption')
 plt.ylim([-1.2, 3.2])
 
 plt.tight_layout()
-plt.savefig('Figure8.png', dpi = 300)
-plt.show()
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure8.png', dpi = dpi, pil_kwargs = {'compress_level': 3})
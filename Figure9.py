@@ -21,24 +21,31 @@ standard deviation for 2019 is also shown in green dotted lines.
 # Import functions
 # =============================================================================
 
+import os
 import numpy as np
+import matplotlib as mpl
+mpl.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from common import weighted_mean
 import calendar
 
 # =============================================================================
 # Load data
 # =============================================================================
 
+#Only 30-90N is averaged, so only those rows are read and converted to float32
+
 #CALIOP observations
-caliop = np.load('caliop_perturbation_daily_zonal_average_extinction_532nm.npy')
+caliop = np.load('caliop_perturbation_daily_zonal_average_extinction_532nm.npy', mmap_mode = 'r')[120:].astype(np.float32)
 #CALIOP tropopause height    
-caliop_tph = np.load('calipso_daily_zonal_average_tropopause_height.npy')
+caliop_tph = np.load('calipso_daily_zonal_average_tropopause_height.npy', mmap_mode = 'r')[120:].astype(np.float32)
 #Model SO2+ash with CALIOP limits imposed
-so2_ash = np.load('SO2_ash_perturbation_monthly_zonal_average_extinction_caliop_limits_532nm_1x1deg.npy')
+so2_ash = np.load('SO2_ash_perturbation_monthly_zonal_average_extinction_caliop_limits_532nm_1x1deg.npy', mmap_mode = 'r')[120:].astype(np.float32)
 #Model SO2only with CALIOP limits imposed
-so2_only = np.load('SO2_only_perturbation_monthly_zonal_average_extinction_caliop_limits_532nm_1x1deg.npy')
+so2_only = np.load('SO2_only_perturbation_monthly_zonal_average_extinction_caliop_limits_532nm_1x1deg.npy', mmap_mode = 'r')[120:].astype(np.float32)
 #Model altitude profile
-model_alts = np.load('Model_altitude.npy')
+model_alts = np.load('Model_altitude.npy').astype(np.float32)
 
 # =============================================================================
 # Create the caliop model mask
@@ -46,42 +53,36 @@ model_alts = np.load('Model_altitude.npy')
 
 #Find model points only where calipso data exists
 caliop_mask = np.nanmean(caliop, axis = (1,2))
-mask = np.ones( (181, 12) )
+mask = np.ones( (61, 12), dtype = np.float32 )
 mask[np.isnan(caliop_mask)] = np.nan
 
-#Mask the model data
-so2_ash_masked = np.zeros( (181, 85, 12) )
-so2_only_masked = np.zeros( (181, 85, 12) )
-for i in range(85):
-    so2_ash_masked[:, i, :] = so2_ash[:, i, :] * mask
-    so2_only_masked[:, i, :] = so2_only[:, i, :] * mask
+#Mask the model data, broadcasting the (lat, month) mask across all levels
+so2_ash_masked = so2_ash * mask[:, None, :]
+so2_only_masked = so2_only * mask[:, None, :]
 
 # =============================================================================
 # Calculate area average
 # =============================================================================
 
-latitude = range(-90, 91)
-#Latitude weighting
-weighting = np.cos(np.deg2rad(latitude))
-
 #Average over 30-90N using weighted averaged based on latitude
-caliop_area_average = np.ma.average(np.ma.masked_invalid(caliop[120:, :, :, :]), axis = 0, weights = weighting[120:])
-so2_ash_area_average = np.ma.average(np.ma.masked_invalid(so2_ash_masked[120:, :, :]), axis = 0, weights = weighting[120:])
-so2_only_area_average = np.ma.average(np.ma.masked_invalid(so2_only_masked[120:, :, :]), axis = 0, weights = weighting[120:])
+caliop_area_average = weighted_mean(caliop)
+so2_ash_area_average = weighted_mean(so2_ash_masked)
+so2_only_area_average = weighted_mean(so2_only_masked)
 
 caliop_monthly_mean = np.nanmean(caliop_area_average, axis = 1)
 caliop_monthly_std = np.nanstd(caliop_area_average, axis = 1)
 
-caliop_mean_tph = np.nanmean(caliop_tph[120:, :, :], axis = (0,1))
-caliop_std_tph = np.nanstd(caliop_tph[120:, :, :], axis = (0,1))
+caliop_mean_tph = np.nanmean(caliop_tph, axis = (0,1))
+caliop_std_tph = np.nanstd(caliop_tph, axis = (0,1))
 
 # =============================================================================
 # Define altitude profile for caliop data
 # =============================================================================
     
-alts1 = np.linspace(-500, 20200, 346)
-alts2 = np.linspace(20380, 29740, 53)
-caliop_alts = np.hstack( (alts1, alts2) )/1000
+caliop_alts = np.empty(399)
+caliop_alts[:346] = np.linspace(-500, 20200, 346)
+caliop_alts[346:] = np.linspace(20380, 29740, 53)
+caliop_alts /= 1000
 
 # =============================================================================
 # Plotting
@@ -90,25 +91,14 @@ caliop_alts = np.hstack( (alts1, alts2) )/1000
 #Create months for plotting dates
 months = calendar.month_name[6:13] + calendar.month_name[1:6]
 
-params = {'legend.fontsize': 25,
-          'axes.labelsize': 30,
-          'axes.titlesize':35,
-          'axes.linewidth':3,
-          'axes.grid': True,
-          'xtick.labelsize':25,
-          'ytick.labelsize':25,
-          'xtick.major.size': 8,
-          'xtick.minor.size': 5,
-          'xtick.minor.visible':True,
-          'ytick.major.size':8,
-          'ytick.minor.size':5,
-          'ytick.minor.visible':True,
-          'lines.linewidth': 4} 
-
-plt.rcParams.update(params)
+#Shared figure style, see wells2023.mplstyle
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wells2023.mplstyle'))
 
 fig = plt.figure(figsize = (27,20))
 
+#Daily profiles keep the default line colour cycle
+cycle_colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+
 fig.text(0.5, 0.08, 'Aerosol extinction coefficient [$x10^{-2}$ km$^{-1}$]', ha = 'center', va = 'center', fontsize = 27, fontweight = 'bold')
 fig.text(0.08, 0.5, 'Altitude [km]', ha = 'center', va = 'center', rotation = 'vertical', fontsize = 27, fontweight = 'bold')
 
@@ -116,7 +106,10 @@ for n in range(6):
     
     ax = plt.subplot(2, 3, n+1)
     
-    ax.plot(caliop_area_average[:, :, n+1]*100000, caliop_alts, linewidth = 2, alpha = 0.4)
+    #Draw all daily profiles for the month as a single collection
+    daily_profiles = caliop_area_average[:, :, n+1]*100000
+    profile_segments = np.stack(np.broadcast_arrays(daily_profiles.T, caliop_alts), axis = -1)
+    ax.add_collection(LineCollection(profile_segments, colors = cycle_colors, linewidths = 2, alpha = 0.4))
     ax.plot(caliop_monthly_mean[:, n+1]*100000, caliop_alts, color = 'navy', linewidth = 4, label = 'CALIOP Mean 532nm')
     ax.plot((caliop_monthly_mean[:, n+1] + caliop_monthly_std[:, n+1])*100000, caliop_alts, '--', color = 'navy', linewidth = 3, label = 'Standard Deviation')
     ax.plot((caliop_monthly_mean[:, n+1] - caliop_monthly_std[:, n+1])*100000, caliop_alts, '--', color = 'navy', linewidth = 3)
@@ -134,7 +127,6 @@ for n in range(6):
     ax.grid(which = 'minor', axis = 'y', alpha = 0.2)
     ax.grid(which = 'minor', axis = 'x', alpha = 0.2)
     
-plt.savefig('Figure9.png', dpi = 300)   
-plt.show()
-
-
+#Set RAIKOKE_DRAFT for a quick low resolution render
+dpi = 150 if os.environ.get('RAIKOKE_DRAFT') else 300
+plt.savefig('Figure9.png', dpi = dpi, pil_kwargs = {'compress_level': 3})
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared latitude weighting for the plotting scripts in Wells et al., 2023
+
+Data are area weighted by the cosine of latitude on the 1x1deg grid
+(-90 to 90) and averaged across 30–90° N.
+
+"""
+# =============================================================================
+# Import functions
+# =============================================================================
+
+import numpy as np
+from numba import njit, prange
+
+# =============================================================================
+# Latitude weighting
+# =============================================================================
+
+#Latitude coordinates
+LAT = np.arange(-90, 91)
+#Latitude weighting
+W = np.cos(np.deg2rad(LAT)).astype(np.float32)
+#Latitude weighting for 30-90N
+W_30_90N = W[120:]
+
+#Reassociation only, no nnan: the kernel has to see the nan it skips
+@njit(parallel = True, fastmath = {'reassoc', 'contract'}, cache = True)
+def weighted_nanmean(data, weights):
+
+    #Weighted average over axis 0 of a 2D array, skipping nan
+    mean = np.empty(data.shape[1])
+    for j in prange(data.shape[1]):
+        total = 0.0
+        weight_total = 0.0
+        for i in range(data.shape[0]):
+            value = data[i, j]
+            if not np.isnan(value):
+                total += value * weights[i]
+                weight_total += weights[i]
+        mean[j] = total / weight_total if weight_total > 0 else np.nan
+
+    return mean
+
+def weighted_mean(data):
+
+    #Weighted average over axis 0 of the 30-90N rows, skipping nan
+    data = np.asarray(data)
+    #The kernel does not bounds check, so the rows must match the weights
+    if data.shape[0] != W_30_90N.size:
+        raise ValueError('Expected the %d rows of 30-90N, got %d' % (W_30_90N.size, data.shape[0]))
+    mean = weighted_nanmean(data.reshape(data.shape[0], -1), W_30_90N)
+
+    return mean.reshape(data.shape[1:])